@@ -1,25 +1,31 @@
 import argparse
-import json
 import os
 import sys
 import re
 import atexit
+import contextlib
 import shutil
+import threading
+import typing
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from subprocess import Popen
 from shutil import copyfile
 from time import strftime
 import logging
 
+import orjson
 import requests
 
 import Utils
 from Utils import is_windows
 
-atexit.register(input, "Press enter to exit.")
-
 # 1 or more digits followed by m or g, then optional b
 max_heap_re = re.compile(r"^\d+[mMgG][bB]?$")
 
+# shared so repeated downloads from the same host reuse pooled connections
+http_session = requests.Session()
+
 
 def prompt_yes_no(prompt):
     yes_inputs = {'yes', 'ye', 'y'}
@@ -34,14 +40,27 @@ def prompt_yes_no(prompt):
             print('Please respond with "y" or "n".')
 
 
+def write_response(resp: requests.Response, f: typing.BinaryIO,
+                   cancel: typing.Optional[threading.Event] = None) -> bool:
+    """Write the body of a streamed response to f without holding all of it in memory.
+    Returns False if cancel was set before the whole body was written."""
+    for chunk in resp.iter_content(chunk_size=256 * 1024):
+        if cancel is not None and cancel.is_set():
+            resp.close()
+            return False
+        f.write(chunk)
+    return True
+
+
 def find_ap_randomizer_jar(forge_dir):
     """Create mods folder if needed; find AP randomizer jar; return None if not found."""
     mods_dir = os.path.join(forge_dir, 'mods')
     if os.path.isdir(mods_dir):
-        for entry in os.scandir(mods_dir):
-            if entry.name.startswith("aprandomizer") and entry.name.endswith(".jar"):
-                logging.info(f"Found AP randomizer mod: {entry.name}")
-                return entry.name
+        with os.scandir(mods_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".jar") and entry.name.startswith("aprandomizer") and entry.is_file():
+                    logging.info(f"Found AP randomizer mod: {entry.name}")
+                    return entry.name
         return None
     else:
         os.mkdir(mods_dir)
@@ -58,50 +77,69 @@ def replace_apmc_files(forge_dir, apmc_file):
     if not os.path.isdir(apdata_dir):
         os.mkdir(apdata_dir)
         logging.info(f"Created APData folder in {forge_dir}")
+    apmc_stat = os.stat(apmc_file)
     for entry in os.scandir(apdata_dir):
         if entry.name.endswith(".apmc") and entry.is_file():
-            if not os.path.samefile(apmc_file, entry.path):
+            # DirEntry.stat() has no inode on Windows, so stat the path; still one call instead of samefile's two
+            if not os.path.samestat(apmc_stat, os.stat(entry.path)):
                 os.remove(entry.path)
                 logging.info(f"Removed {entry.name} in {apdata_dir}")
             else: # apmc already in apdata
                 copy_apmc = False
     if copy_apmc:
-        copyfile(apmc_file, os.path.join(apdata_dir, os.path.basename(apmc_file)))
-        logging.info(f"Copied {os.path.basename(apmc_file)} to {apdata_dir}")
+        target = os.path.join(apdata_dir, os.path.basename(apmc_file))
+        try:
+            # a hard link is instant when both are on the same volume
+            os.link(apmc_file, target)
+            logging.info(f"Linked {os.path.basename(apmc_file)} into {apdata_dir}")
+        except OSError:
+            copyfile(apmc_file, target)
+            logging.info(f"Copied {os.path.basename(apmc_file)} to {apdata_dir}")
 
 
 def read_apmc_file(apmc_file):
     from base64 import b64decode
 
-    with open(apmc_file, 'r') as f:
-        return json.loads(b64decode(f.read()))
+    with open(apmc_file, 'rb') as f:
+        data = f.read()
+    # apmc files are base64 encoded, but accept plain JSON as well
+    if data.lstrip().startswith(b'{'):
+        return orjson.loads(data)
+    return orjson.loads(b64decode(data))
 
 
 def update_mod(forge_dir, url: str):
     """Check mod version, download new mod from GitHub releases page if needed. """
     ap_randomizer = find_ap_randomizer_jar(forge_dir)
-    os.path.basename(url)
+    new_mod_name = os.path.basename(url)
     if ap_randomizer is not None:
         logging.info(f"Your current mod is {ap_randomizer}.")
     else:
         logging.info(f"You do not have the AP randomizer mod installed.")
 
-    if ap_randomizer != os.path.basename(url):
+    if ap_randomizer != new_mod_name:
         logging.info(f"A new release of the Minecraft AP randomizer mod was found: "
-                     f"{os.path.basename(url)}")
+                     f"{new_mod_name}")
         if prompt_yes_no("Would you like to update?"):
             old_ap_mod = os.path.join(forge_dir, 'mods', ap_randomizer) if ap_randomizer is not None else None
-            new_ap_mod = os.path.join(forge_dir, 'mods', os.path.basename(url))
+            new_ap_mod = os.path.join(forge_dir, 'mods', new_mod_name)
             logging.info("Downloading AP randomizer mod. This may take a moment...")
-            apmod_resp = requests.get(url)
+            apmod_resp = http_session.get(url, stream=True)
             if apmod_resp.status_code == 200:
-                with open(new_ap_mod, 'wb') as f:
-                    f.write(apmod_resp.content)
-                    logging.info(f"Wrote new mod file to {new_ap_mod}")
+                # download next to the mod and swap it in, so a dropped connection can't leave a truncated jar
+                try:
+                    with open(new_ap_mod + ".part", 'wb') as f:
+                        write_response(apmod_resp, f)
+                except BaseException:
+                    os.remove(new_ap_mod + ".part")
+                    raise
+                os.replace(new_ap_mod + ".part", new_ap_mod)
+                logging.info(f"Wrote new mod file to {new_ap_mod}")
                 if old_ap_mod is not None:
                     os.remove(old_ap_mod)
                     logging.info(f"Removed old mod file from {old_ap_mod}")
             else:
+                apmod_resp.close()
                 logging.error(f"Error retrieving the randomizer mod (status code {apmod_resp.status_code}).")
                 logging.error(f"Please report this issue on the Archipelago Discord server.")
                 sys.exit(1)
@@ -110,32 +148,39 @@ def update_mod(forge_dir, url: str):
 def check_eula(forge_dir):
     """Check if the EULA is agreed to, and prompt the user to read and agree if necessary."""
     eula_path = os.path.join(forge_dir, "eula.txt")
-    if not os.path.isfile(eula_path):
-        # Create eula.txt
-        with open(eula_path, 'w') as f:
-            f.write("#By changing the setting below to TRUE you are indicating your agreement to our EULA (https://account.mojang.com/documents/minecraft_eula).\n")
-            f.write(f"#{strftime('%a %b %d %X %Z %Y')}\n")
-            f.write("eula=false\n")
-    with open(eula_path, 'r+') as f:
-        text = f.read()
-        if 'false' in text:
-            # Prompt user to agree to the EULA
-            logging.info("You need to agree to the Minecraft EULA in order to run the server.")
-            logging.info("The EULA can be found at https://account.mojang.com/documents/minecraft_eula")
-            if prompt_yes_no("Do you agree to the EULA?"):
-                f.seek(0)
-                f.write(text.replace('false', 'true'))
-                f.truncate()
-                logging.info(f"Set {eula_path} to true")
-            else:
-                sys.exit(0)
+    # binary mode keeps the file's line endings intact when it is rewritten
+    created = not os.path.isfile(eula_path)
+    if created:
+        text = ("#By changing the setting below to TRUE you are indicating your agreement to our EULA (https://account.mojang.com/documents/minecraft_eula).\n"
+                f"#{strftime('%a %b %d %X %Z %Y')}\n"
+                "eula=false\n").encode()
+    else:
+        with open(eula_path, 'rb') as f:
+            text = f.read()
+    if b'eula=false' in text:
+        # Prompt user to agree to the EULA
+        logging.info("You need to agree to the Minecraft EULA in order to run the server.")
+        logging.info("The EULA can be found at https://account.mojang.com/documents/minecraft_eula")
+        agreed = prompt_yes_no("Do you agree to the EULA?")
+        if agreed:
+            text = text.replace(b'eula=false', b'eula=true')
+        if agreed or created:
+            # write a temporary file and swap it in, so an interrupted write can't leave a truncated eula.txt
+            with open(eula_path + ".tmp", 'wb') as f:
+                f.write(text)
+            os.replace(eula_path + ".tmp", eula_path)
+        if not agreed:
+            sys.exit(0)
+        logging.info(f"Set {eula_path} to true")
 
 
 def find_jdk_dir(version: str) -> str:
     """get the specified versions jdk directory"""
-    for entry in os.listdir():
-        if os.path.isdir(entry) and entry.startswith(f"jdk{version}"):
-            return os.path.abspath(entry)
+    prefix = f"jdk{version}"
+    with os.scandir() as entries:
+        for entry in entries:
+            if entry.name.startswith(prefix) and entry.is_dir():
+                return os.path.abspath(entry.path)
 
 
 def find_jdk(version: str) -> str:
@@ -147,55 +192,146 @@ def find_jdk(version: str) -> str:
         if os.path.isfile(jdk_exe):
             return jdk_exe
     else:
-        jdk_exe = shutil.which(options["minecraft_options"].get("java", "java"))
+        jdk_exe = shutil.which(minecraft_options.get("java", "java"))
         if not jdk_exe:
             raise Exception("Could not find Java. Is Java installed on the system?")
         return jdk_exe
 
 
-def download_java(java: str):
-    """Download Corretto (Amazon JDK)"""
-
-    jdk = find_jdk_dir(java)
-    if jdk is not None:
-        print(f"Removing old JDK...")
-        from shutil import rmtree
-        rmtree(jdk)
-
-    print(f"Downloading Java...")
-    jdk_url = f"https://corretto.aws/downloads/latest/amazon-corretto-{java}-x64-windows-jdk.zip"
-    resp = requests.get(jdk_url)
+def extract_zip_member(archive: zipfile.ZipFile, member: zipfile.ZipInfo, path: str):
+    """Extract a single member, tolerating the directory races of extracting from several threads."""
+    try:
+        archive.extract(member, path)
+    except FileExistsError:
+        # another worker created a shared parent directory between ZipFile's exists check and its makedirs
+        archive.extract(member, path)
+
+
+def extract_zip_parallel(archive: zipfile.ZipFile, path: str = "."):
+    """Extract all members of archive into path, inflating files on a thread pool."""
+    # ZipFile serializes the raw reads internally and zlib releases the GIL while inflating
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+        for _ in pool.map(lambda member: extract_zip_member(archive, member, path), archive.infolist()):
+            pass
+
+
+def download_java(java: str, jdk: typing.Optional[str] = None):
+    """Download Corretto (Amazon JDK), replacing the existing jdk directory if one is given"""
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        old_jdk_removal = None
+        if jdk is not None:
+            print(f"Removing old JDK...")
+            from shutil import rmtree
+            # delete the old JDK in the background while the new one downloads
+            old_jdk_removal = pool.submit(rmtree, jdk)
+        try:
+            print(f"Downloading Java...")
+            jdk_url = f"https://corretto.aws/downloads/latest/amazon-corretto-{java}-x64-windows-jdk.zip"
+            resp = http_session.get(jdk_url, stream=True)
+            if old_jdk_removal is not None and old_jdk_removal.done() and old_jdk_removal.exception():
+                # fail before spooling the whole JDK, e.g. when java.exe is still in use
+                resp.close()
+                old_jdk_removal.result()
+            if resp.status_code == 200:  # OK
+                import tempfile
+                # spool the archive to disk rather than holding the whole JDK in memory
+                with tempfile.TemporaryFile() as jdk_zip:
+                    write_response(resp, jdk_zip)
+                    if old_jdk_removal is not None:
+                        old_jdk_removal.result()  # the new JDK may extract into the same directory
+                    print(f"Extracting...")
+                    with zipfile.ZipFile(jdk_zip) as zf:
+                        extract_zip_parallel(zf)
+            else:
+                resp.close()
+                if old_jdk_removal is not None:
+                    old_jdk_removal.result()
+                print(f"Error downloading Java (status code {resp.status_code}).")
+                print(f"If this was not expected, please report this issue on the Archipelago Discord server.")
+                if not prompt_yes_no("Continue anyways?"):
+                    sys.exit(0)
+        finally:
+            if old_jdk_removal is not None:
+                # re-raise a failed removal even if the download itself failed, so it is never silently dropped
+                old_jdk_removal.result()
+
+
+def download_forge_installer(directory: str, forge_version: str,
+                             cancel: typing.Optional[threading.Event] = None) -> typing.Optional[str]:
+    """download the forge installer, returning its path if successful and not cancelled"""
+
+    # runs on a worker thread while the main thread may be prompting, so this must not print
+    forge_url = f"https://maven.minecraftforge.net/net/minecraftforge/forge/{forge_version}/forge-{forge_version}-installer.jar"
+    resp = http_session.get(forge_url, stream=True)
     if resp.status_code == 200:  # OK
-        print(f"Extracting...")
-        import zipfile
-        from io import BytesIO
-        with zipfile.ZipFile(BytesIO(resp.content)) as zf:
-            zf.extractall()
-    else:
-        print(f"Error downloading Java (status code {resp.status_code}).")
-        print(f"If this was not expected, please report this issue on the Archipelago Discord server.")
-        if not prompt_yes_no("Continue anyways?"):
-            sys.exit(0)
+        forge_install_jar = os.path.join(directory, "forge_install.jar")
+        if not os.path.exists(directory):
+            os.mkdir(directory)
+        try:
+            with open(forge_install_jar, 'wb') as f:
+                complete = write_response(resp, f, cancel)
+        except BaseException:
+            os.remove(forge_install_jar)  # don't leave a truncated installer behind
+            raise
+        if not complete:
+            os.remove(forge_install_jar)
+            return None
+        return forge_install_jar
+    resp.close()
+    return None
 
 
-def install_forge(directory: str, forge_version: str, java_version: str):
-    """download and install forge"""
+def install_forge(directory: str, forge_version: str, java_version: str, forge_install_jar: typing.Optional[str]):
+    """install forge from the downloaded installer, which is None if the download failed"""
 
-    java_exe = find_jdk(java_version)
-    if java_exe is not None:
-        print(f"Downloading Forge {forge_version}...")
-        forge_url = f"https://maven.minecraftforge.net/net/minecraftforge/forge/{forge_version}/forge-{forge_version}-installer.jar"
-        resp = requests.get(forge_url)
-        if resp.status_code == 200:  # OK
-            forge_install_jar = os.path.join(directory, "forge_install.jar")
-            if not os.path.exists(directory):
-                os.mkdir(directory)
-            with open(forge_install_jar, 'wb') as f:
-                f.write(resp.content)
+    if forge_install_jar is None:
+        print(f"Error downloading Forge {forge_version}.")
+        print(f"If this was not expected, please report this issue on the Archipelago Discord server.")
+        return
+    try:
+        java_exe = find_jdk(java_version)
+        if java_exe is not None:
             print(f"Installing Forge...")
             install_process = Popen([java_exe, "-jar", forge_install_jar, "--installServer", directory])
             install_process.wait()
-            os.remove(forge_install_jar)
+    finally:
+        os.remove(forge_install_jar)
+
+
+def discard_forge_installer(forge_installer: typing.Optional[Future]):
+    """wait for a prefetched forge installer and remove it if install_forge did not get to use it"""
+
+    if forge_installer is None:
+        return
+    try:
+        forge_install_jar = forge_installer.result()
+    except Exception:
+        return
+    if forge_install_jar is not None and os.path.isfile(forge_install_jar):
+        os.remove(forge_install_jar)
+
+
+@contextlib.contextmanager
+def prefetch_forge_installer(directory: str, forge_version: str, enabled: bool = True):
+    """Download the forge installer in the background while the body runs, yielding its Future (or None).
+    The forge installer does not depend on java, so it can be fetched while java downloads."""
+    if not enabled:
+        yield None
+        return
+    print(f"Downloading Forge {forge_version}...")
+    cancel = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=1)
+    forge_installer = pool.submit(download_forge_installer, directory, forge_version, cancel)
+    try:
+        yield forge_installer
+    except BaseException:
+        # aborting (including Ctrl+C or sys.exit), so stop the download at its next chunk instead of finishing it
+        cancel.set()
+        raise
+    finally:
+        pool.shutdown()
+        discard_forge_installer(forge_installer)
 
 
 def run_forge_server(forge_dir: str, java_version: str, heap_arg: str) -> Popen:
@@ -211,11 +347,9 @@ def run_forge_server(forge_dir: str, java_version: str, heap_arg: str) -> Popen:
     heap_arg = "-Xmx" + heap_arg
 
     os_args = "win_args.txt" if is_windows else "unix_args.txt"
-    args_file = os.path.join(forge_dir, "libraries", "net", "minecraftforge", "forge", forge_version, os_args)
-    forge_args = []
+    args_file = os.path.join(forge_library_dir(forge_dir), os_args)
     with open(args_file) as argfile:
-        for line in argfile:
-            forge_args.extend(line.strip().split(" "))
+        forge_args = argfile.read().split()
 
     args = [java_exe, heap_arg, *forge_args, "-nogui"]
     logging.info(f"Running Forge server: {args}")
@@ -223,14 +357,58 @@ def run_forge_server(forge_dir: str, java_version: str, heap_arg: str) -> Popen:
     return Popen(args)
 
 
+def load_cache_validators(versions_path: str, cache_headers_path: str) -> typing.Dict[str, str]:
+    """conditional request headers that revalidate the cached versions file, if there is a usable one"""
+    request_headers = {}
+    if os.path.isfile(versions_path) and os.path.isfile(cache_headers_path):
+        with open(cache_headers_path, 'rb') as f:
+            try:
+                cache_headers = orjson.loads(f.read())
+            except orjson.JSONDecodeError:
+                cache_headers = None
+        if not isinstance(cache_headers, dict):
+            return request_headers  # corrupt cache metadata, fetch the file unconditionally
+        if cache_headers.get("etag"):
+            request_headers["If-None-Match"] = cache_headers["etag"]
+        if cache_headers.get("last_modified"):
+            request_headers["If-Modified-Since"] = cache_headers["last_modified"]
+    return request_headers
+
+
+def store_versions(resp: requests.Response, versions_path: str, cache_headers_path: str):
+    """save a freshly fetched versions file along with the validators needed to revalidate it"""
+    # only rewrite the local copy when the remote file actually changed
+    local_content = None
+    if os.path.isfile(versions_path):
+        with open(versions_path, 'rb') as f:
+            local_content = f.read()
+    # write next to the cache and swap it in, so an interrupted write never leaves a truncated file
+    if local_content != resp.content:
+        with open(versions_path + ".tmp", 'wb') as f:
+            f.write(resp.content)
+        os.replace(versions_path + ".tmp", versions_path)
+    with open(cache_headers_path + ".tmp", 'wb') as f:
+        f.write(orjson.dumps({"etag": resp.headers.get("ETag"),
+                              "last_modified": resp.headers.get("Last-Modified")}))
+    os.replace(cache_headers_path + ".tmp", cache_headers_path)
+
+
 def get_minecraft_versions(version, release_channel="release"):
     version_file_endpoint = "https://raw.githubusercontent.com/KonoTyran/Minecraft_AP_Randomizer/master/versions/minecraft_versions.json"
-    resp = requests.get(version_file_endpoint)
+    versions_path = Utils.user_path("minecraft_versions.json")
+    cache_headers_path = Utils.user_path("minecraft_versions.meta.json")
+
+    # revalidate the cached copy instead of downloading it again if it is unchanged
+    request_headers = load_cache_validators(versions_path, cache_headers_path)
+    resp = http_session.get(version_file_endpoint, headers=request_headers)
     local = False
-    if resp.status_code == 200:  # OK
+    if resp.status_code == 304:  # Not Modified
+        logging.info("Version update file is unchanged, using local version.")
+        local = True
+    elif resp.status_code == 200:  # OK
         try:
-            data = resp.json()
-        except requests.exceptions.JSONDecodeError:
+            data = orjson.loads(resp.content)
+        except orjson.JSONDecodeError:
             logging.warning(f"Unable to fetch version update file, using local version. (status code {resp.status_code}).")
             local = True
     else:
@@ -238,18 +416,20 @@ def get_minecraft_versions(version, release_channel="release"):
         local = True
 
     if local:
-        with open(Utils.user_path("minecraft_versions.json"), 'r') as f:
-            data = json.load(f)
+        with open(versions_path, 'rb') as f:
+            data = orjson.loads(f.read())
     else:
-        with open(Utils.user_path("minecraft_versions.json"), 'w') as f:
-            json.dump(data, f)
+        store_versions(resp, versions_path, cache_headers_path)
 
-    try:
-        if version:
-            return next(filter(lambda entry: entry["version"] == version, data[release_channel]))
-        else:
-            return resp.json()[release_channel][0]
-    except (StopIteration, KeyError):
+    channel_versions = data.get(release_channel, [])
+    if version:
+        mod_version = next((entry for entry in channel_versions if entry["version"] == version), None)
+    else:
+        mod_version = channel_versions[0] if channel_versions else None
+
+    if mod_version is not None:
+        return mod_version
+    else:
         logging.error(f"No compatible mod version found for client version {version} on \"{release_channel}\" channel.")
         if release_channel != "release":
             logging.error("Consider switching \"release_channel\" to \"release\" in your Host.yaml file")
@@ -258,13 +438,17 @@ def get_minecraft_versions(version, release_channel="release"):
         sys.exit(0)
 
 
+def forge_library_dir(forge_dir: str) -> str:
+    """get the library directory of the selected forge version"""
+    return os.path.join(forge_dir, "libraries", "net", "minecraftforge", "forge", forge_version)
+
+
 def is_correct_forge(forge_dir) -> bool:
-    if os.path.isdir(os.path.join(forge_dir, "libraries", "net", "minecraftforge", "forge", forge_version)):
-        return True
-    return False
+    return os.path.isdir(forge_library_dir(forge_dir))
 
 
 if __name__ == '__main__':
+    atexit.register(input, "Press enter to exit.")
     Utils.init_logging("MinecraftClient")
     parser = argparse.ArgumentParser()
     parser.add_argument("apmc_file", default=None, nargs='?', help="Path to an Archipelago Minecraft data file (.apmc)")
@@ -285,8 +469,8 @@ if __name__ == '__main__':
     # Change to executable's working directory
     os.chdir(os.path.abspath(os.path.dirname(sys.argv[0])))
 
-    options = Utils.get_options()
-    channel = args.channel or options["minecraft_options"]["release_channel"]
+    minecraft_options = Utils.get_options()["minecraft_options"]
+    channel = args.channel or minecraft_options["release_channel"]
     apmc_data = None
     data_version = args.data_version or None
 
@@ -299,40 +483,48 @@ if __name__ == '__main__':
 
     versions = get_minecraft_versions(data_version, channel)
 
-    forge_dir = options["minecraft_options"]["forge_directory"]
-    max_heap = options["minecraft_options"]["max_heap_size"]
+    forge_dir = minecraft_options["forge_directory"]
+    max_heap = minecraft_options["max_heap_size"]
     forge_version = args.forge or versions["forge"]
     java_version = args.java or versions["java"]
     mod_url = versions["url"]
     java_dir = find_jdk_dir(java_version)
 
     if args.install:
-        if is_windows:
-            print("Installing Java")
-            download_java(java_version)
-        if not is_correct_forge(forge_dir):
-            print("Installing Minecraft Forge")
-            install_forge(forge_dir, forge_version, java_version)
-        else:
-            print("Correct Forge version already found, skipping install.")
+        with prefetch_forge_installer(forge_dir, forge_version, not is_correct_forge(forge_dir)) as forge_installer:
+            if is_windows:
+                print("Installing Java")
+                download_java(java_version, java_dir)
+            if forge_installer is not None:
+                print("Installing Minecraft Forge")
+                install_forge(forge_dir, forge_version, java_version, forge_installer.result())
+            else:
+                print("Correct Forge version already found, skipping install.")
         sys.exit(0)
 
     if apmc_data is None:
         raise FileNotFoundError(f"APMC file does not exist or is inaccessible at the given location ({apmc_file})")
 
-    if is_windows:
-        if java_dir is None or not os.path.isdir(java_dir):
-            if prompt_yes_no("Did not find java directory. Download and install java now?"):
-                download_java(java_version)
-                java_dir = find_jdk_dir(java_version)
+    download_jdk = False
+    if is_windows and (java_dir is None or not os.path.isdir(java_dir)):
+        download_jdk = prompt_yes_no("Did not find java directory. Download and install java now?")
+        if not download_jdk:
+            raise NotADirectoryError(f"Path {java_dir} does not exist or could not be accessed.")
+
+    missing_forge = not is_correct_forge(forge_dir)
+    install_missing_forge = missing_forge and prompt_yes_no(
+        f"Did not find forge version {forge_version} download and install it now?")
+
+    with prefetch_forge_installer(forge_dir, forge_version, install_missing_forge) as forge_installer:
+        if download_jdk:
+            download_java(java_version, java_dir)
+            java_dir = find_jdk_dir(java_version)
             if java_dir is None or not os.path.isdir(java_dir):
                 raise NotADirectoryError(f"Path {java_dir} does not exist or could not be accessed.")
-
-    if not is_correct_forge(forge_dir):
-        if prompt_yes_no(f"Did not find forge version {forge_version} download and install it now?"):
-            install_forge(forge_dir, forge_version, java_version)
-        if not os.path.isdir(forge_dir):
-            raise NotADirectoryError(f"Path {forge_dir} does not exist or could not be accessed.")
+        if forge_installer is not None:
+            install_forge(forge_dir, forge_version, java_version, forge_installer.result())
+    if missing_forge and not os.path.isdir(forge_dir):
+        raise NotADirectoryError(f"Path {forge_dir} does not exist or could not be accessed.")
 
     if not max_heap_re.match(max_heap):
         raise Exception(f"Max heap size {max_heap} in incorrect format. Use a number followed by M or G, e.g. 512M or 2G.")
@@ -1,10 +1,11 @@
 import os
-import json
+import orjson
 import pkgutil
+import sys
 
 def load_data_file(*args) -> dict:
     fname = os.path.join("data", *args)
-    return json.loads(pkgutil.get_data(__name__, fname).decode())
+    return orjson.loads(pkgutil.get_data(__name__, fname))
 
 # For historical reasons, these values are different.
 # They remain different to ensure datapackage consistency.
@@ -17,10 +18,20 @@ item_name_to_id = {name: item_id_offset + index \
 	for index, name in enumerate(item_info["all_items"])}
 item_name_to_id["Bee Trap"] = item_id_offset + 100  # historical reasons
 
+progression_item_names = frozenset(item_info["progression_items"])
+useful_item_names = frozenset(item_info["useful_items"])
+trap_item_names = frozenset(item_info["trap_items"])
+
 location_info = load_data_file("locations.json")
-location_name_to_id = {name: location_id_offset + index \
+# location names are interned so every Location shares the key object used by the id and cache lookups
+location_name_to_id = {sys.intern(name): location_id_offset + index \
 	for index, name in enumerate(location_info["all_locations"])}
+location_ids_by_region = {region: {sys.intern(name): location_name_to_id[name] for name in locations} \
+	for region, locations in location_info["locations_by_region"].items()}
 
 exclusion_info = load_data_file("excluded_locations.json")
 
 region_info = load_data_file("regions.json")
+regions = tuple((name, tuple(exits)) for name, exits in region_info["regions"])
+mandatory_connections = tuple((entrance, region) for entrance, region in region_info["mandatory_connections"])
+structure_exits = tuple(entrance for entrance, _ in region_info["default_connections"])
@@ -26,7 +26,7 @@ def build_item_pool(mc_world: World) -> List[Item]:
 
 	# Add required progression items
 	for item_name, num in required_pool.items():
-		itempool += [mc_world.create_item(item_name) for _ in range(num)]
+		itempool.extend(mc_world.create_item(item_name) for _ in range(num))
 
 	# Add structure compasses
 	if multiworld.structure_compasses[player]:
@@ -37,16 +37,16 @@ def build_item_pool(mc_world: World) -> List[Item]:
 	# Dragon egg shards
 	if multiworld.egg_shards_required[player] > 0:
 		num = multiworld.egg_shards_available[player]
-		itempool += [mc_world.create_item("Dragon Egg Shard") for _ in range(num)]
+		itempool.extend(mc_world.create_item("Dragon Egg Shard") for _ in range(num))
 
 	# Bee traps
 	bee_trap_percentage = multiworld.bee_traps[player] * 0.01
 	if bee_trap_percentage > 0:
 		bee_trap_qty = ceil(bee_trap_percentage * (total_location_count - len(itempool)))
-		itempool += [mc_world.create_item("Bee Trap") for _ in range(bee_trap_qty)]
+		itempool.extend(mc_world.create_item("Bee Trap") for _ in range(bee_trap_qty))
 
 	# Fill remaining itempool with randomly generated junk
 	junk = get_junk_item_names(multiworld.random, total_location_count - len(itempool))
-	itempool += [mc_world.create_item(name) for name in junk]
+	itempool.extend(mc_world.create_item(name) for name in junk)
 
 	return itempool
@@ -1,5 +1,6 @@
 import os
-import json
+import functools
+import orjson
 import settings
 import typing
 from base64 import b64encode, b64decode
@@ -16,6 +17,13 @@ from .Rules import set_rules
 
 client_version = 9
 
+# later entries win, so progression takes priority over useful and useful over trap
+item_classifications: Dict[str, ItemClassification] = {
+    **{name: ItemClassification.trap for name in Constants.trap_item_names},
+    **{name: ItemClassification.useful for name in Constants.useful_item_names},
+    **{name: ItemClassification.progression for name in Constants.progression_item_names},
+}
+
 
 class MinecraftSettings(settings.Group):
     class ForgeDirectory(settings.OptionalUserFolderPath):
@@ -95,34 +103,29 @@ class MinecraftWorld(World):
     data_version = 7
 
     def _get_mc_data(self) -> Dict[str, Any]:
-        exits = [connection[0] for connection in Constants.region_info["default_connections"]]
+        multiworld = self.multiworld
+        player = self.player
+        egg_shards_available = multiworld.egg_shards_available[player].value
         return {
-            'world_seed': self.multiworld.per_slot_randoms[self.player].getrandbits(32),
-            'seed_name': self.multiworld.seed_name,
-            'player_name': self.multiworld.get_player_name(self.player),
-            'player_id': self.player,
+            'world_seed': multiworld.per_slot_randoms[player].getrandbits(32),
+            'seed_name': multiworld.seed_name,
+            'player_name': multiworld.get_player_name(player),
+            'player_id': player,
             'client_version': client_version,
-            'structures': {exit: self.multiworld.get_entrance(exit, self.player).connected_region.name for exit in exits},
-            'advancement_goal': self.multiworld.advancement_goal[self.player].value,
-            'egg_shards_required': min(self.multiworld.egg_shards_required[self.player].value,
-                                       self.multiworld.egg_shards_available[self.player].value),
-            'egg_shards_available': self.multiworld.egg_shards_available[self.player].value,
-            'required_bosses': self.multiworld.required_bosses[self.player].current_key,
-            'MC35': bool(self.multiworld.send_defeated_mobs[self.player].value),
-            'death_link': bool(self.multiworld.death_link[self.player].value),
-            'starting_items': str(self.multiworld.starting_items[self.player].value),
-            'race': self.multiworld.is_race,
+            'structures': {exit: multiworld.get_entrance(exit, player).connected_region.name
+                           for exit in Constants.structure_exits},
+            'advancement_goal': multiworld.advancement_goal[player].value,
+            'egg_shards_required': min(multiworld.egg_shards_required[player].value, egg_shards_available),
+            'egg_shards_available': egg_shards_available,
+            'required_bosses': multiworld.required_bosses[player].current_key,
+            'MC35': bool(multiworld.send_defeated_mobs[player].value),
+            'death_link': bool(multiworld.death_link[player].value),
+            'starting_items': str(multiworld.starting_items[player].value),
+            'race': multiworld.is_race,
         }
 
     def create_item(self, name: str) -> Item:
-        item_class = ItemClassification.filler
-        if name in Constants.item_info["progression_items"]:
-            item_class = ItemClassification.progression
-        elif name in Constants.item_info["useful_items"]:
-            item_class = ItemClassification.useful
-        elif name in Constants.item_info["trap_items"]:
-            item_class = ItemClassification.trap
-
+        item_class = item_classifications.get(name, ItemClassification.filler)
         return MinecraftItem(name, item_class, self.item_name_to_id.get(name, None), self.player)
 
     def create_event(self, region_name: str, event_name: str) -> None:
@@ -131,32 +134,28 @@ class MinecraftWorld(World):
         loc.place_locked_item(self.create_event_item(event_name))
         region.locations.append(loc)
 
-    def create_event_item(self, name: str) -> None:
-        item = self.create_item(name)
-        item.classification = ItemClassification.progression
-        return item
+    def create_event_item(self, name: str) -> Item:
+        return MinecraftItem(name, ItemClassification.progression, None, self.player)
 
     def create_regions(self) -> None:
+        regions: Dict[str, Region] = {}
+        entrances: Dict[str, Entrance] = {}
+
         # Create regions
-        for region_name, exits in Constants.region_info["regions"]:
-            r = Region(region_name, self.player, self.multiworld)
+        for region_name, exits in Constants.regions:
+            r = regions[region_name] = Region(region_name, self.player, self.multiworld)
             for exit_name in exits:
-                r.exits.append(Entrance(self.player, exit_name, r))
+                e = entrances[exit_name] = Entrance(self.player, exit_name, r)
+                r.exits.append(e)
             self.multiworld.regions.append(r)
 
         # Bind mandatory connections
-        for entr_name, region_name in Constants.region_info["mandatory_connections"]:
-            e = self.multiworld.get_entrance(entr_name, self.player)
-            r = self.multiworld.get_region(region_name, self.player)
-            e.connect(r)
+        for entr_name, region_name in Constants.mandatory_connections:
+            entrances[entr_name].connect(regions[region_name])
 
         # Add locations
-        for region_name, locations in Constants.location_info["locations_by_region"].items():
-            region = self.multiworld.get_region(region_name, self.player)
-            for loc_name in locations:
-                loc = MinecraftLocation(self.player, loc_name,
-                    self.location_name_to_id.get(loc_name, None), region)
-                region.locations.append(loc)
+        for region_name, locations in Constants.location_ids_by_region.items():
+            regions[region_name].add_locations(locations, MinecraftLocation)
 
         # Add events
         self.create_event("Nether Fortress", "Blaze Rods")
@@ -167,15 +166,15 @@ class MinecraftWorld(World):
         shuffle_structures(self)
 
     def create_items(self) -> None:
-        self.multiworld.itempool += build_item_pool(self)
+        self.multiworld.itempool.extend(build_item_pool(self))
 
     set_rules = set_rules
 
     def generate_output(self, output_directory: str) -> None:
-        data = self._get_mc_data()
+        payload = b64encode(orjson.dumps(self._get_mc_data()))
         filename = f"{self.multiworld.get_out_file_name_base(self.player)}.apmc"
         with open(os.path.join(output_directory, filename), 'wb') as f:
-            f.write(b64encode(bytes(json.dumps(data), 'utf-8')))
+            f.write(payload)
 
     def fill_slot_data(self) -> dict:
         slot_data = self._get_mc_data()
@@ -194,10 +193,23 @@ class MinecraftLocation(Location):
 
 class MinecraftItem(Item):
     game = "Minecraft"
+    __slots__ = ()  # disable __dict__
 
 
 def mc_update_output(raw_data, server, port):
-    data = json.loads(b64decode(raw_data))
-    data['server'] = server
-    data['port'] = port
-    return b64encode(bytes(json.dumps(data), 'utf-8'))
+    data = b64decode(raw_data)
+    end = data.rfind(b'}')
+    if end == -1 or data[:end].rstrip().endswith(b'{') or b'"server"' in data or b'"port"' in data:
+        # not a populated object without connection info, so rebuild it the slow way
+        data = orjson.loads(data)
+        data['server'] = server
+        data['port'] = port
+        return b64encode(orjson.dumps(data))
+    # splice the connection info onto the end of the object instead of re-encoding the whole payload
+    return b64encode(data[:end] + b',' + _connection_fragment(server, port))
+
+
+@functools.lru_cache(maxsize=32)
+def _connection_fragment(server, port) -> bytes:
+    """Serialized server/port members without the opening brace, ready to close an existing object."""
+    return orjson.dumps({'server': server, 'port': port})[1:]
@@ -0,0 +1,23 @@
+import unittest
+from base64 import b64decode, b64encode
+
+import orjson
+
+from .. import mc_update_output
+
+
+class TestOutput(unittest.TestCase):
+
+    def test_update_output(self):
+        data = {'world_seed': 1234, 'player_name': 'Player1', 'structures': {'Overworld Structure 1': 'Village'}}
+        updated = orjson.loads(b64decode(mc_update_output(b64encode(orjson.dumps(data)), "localhost", 38281)))
+        self.assertEqual(updated, {**data, 'server': "localhost", 'port': 38281})
+
+    def test_update_output_existing_connection(self):
+        data = {'world_seed': 1234, 'server': "archipelago.gg", 'port': 1}
+        updated = orjson.loads(b64decode(mc_update_output(b64encode(orjson.dumps(data)), "localhost", 38281)))
+        self.assertEqual(updated, {'world_seed': 1234, 'server': "localhost", 'port': 38281})
+
+    def test_update_output_empty(self):
+        updated = orjson.loads(b64decode(mc_update_output(b64encode(b'{ }'), "localhost", 38281)))
+        self.assertEqual(updated, {'server': "localhost", 'port': 38281})